@@ -10,6 +10,9 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     DEBUG: bool = False
     GROQ_API_KEY: str = ""
+    GROUP_COMMIT_ENABLED: bool = False
+    GROUP_COMMIT_MAX_BATCH: int = 64
+    GROUP_COMMIT_WINDOW_MS: int = 0
     
     model_config = SettingsConfigDict(env_file=".env")
 
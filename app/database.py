@@ -1,5 +1,6 @@
 from sqlmodel import create_engine, SQLModel, Session
 from .config import settings
+from .utils.group_commit import GroupCommitter
 
 engine = create_engine(
     settings.DATABASE_URL,
@@ -9,6 +10,13 @@ engine = create_engine(
     max_overflow=20
 )
 
+# Optional: coalesce concurrent item writes into shared commits
+group_committer = GroupCommitter(
+    engine,
+    max_batch=settings.GROUP_COMMIT_MAX_BATCH,
+    window_ms=settings.GROUP_COMMIT_WINDOW_MS
+) if settings.GROUP_COMMIT_ENABLED else None
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
-from .database import create_db_and_tables
+from .database import create_db_and_tables, group_committer
 from .routers import auth, items
 
 
@@ -25,6 +25,11 @@ app.include_router(items.router)
 def on_startup():
     create_db_and_tables()
 
+@app.on_event("shutdown")
+def on_shutdown():
+    if group_committer is not None:
+        group_committer.stop()
+
 @app.get("/")
 def read_root():
     return {"message": f"Welcome to {settings.PROJECT_NAME}"}
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, insert, update
 from sqlmodel import Session, select
 from typing import List
 from uuid import UUID
 from datetime import datetime
-from ..database import get_session
+from ..database import get_session, group_committer
 from ..models.models import Item, User
 from ..schemas.item import ItemCreate, ItemResponse, ItemUpdate
 from ..dependencies.auth import get_current_user
@@ -12,6 +13,31 @@ from ..utils.ai import extract_search_terms
 
 router = APIRouter(prefix="/api/items", tags=["Items"])
 
+
+def _write(session: Session, operation):
+    """Run a write operation and commit it, through the group committer if enabled"""
+    if group_committer is not None:
+        # Return this request's connection to the pool while it waits in the queue
+        session.close()
+        return group_committer.submit(operation)
+    result = operation(session)
+    session.commit()
+    return result
+
+
+def _raise_missing_or_forbidden(session: Session, item_id: UUID, action: str):
+    """An owner-scoped write matched no row: report 404 or 403 accordingly"""
+    exists = session.exec(select(Item.id).where(Item.id == item_id)).first()
+    if exists is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Item not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Not authorized to {action} this item"
+    )
+
 @router.post("", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
 def create_item(
     item_data: ItemCreate,
@@ -24,10 +50,13 @@ def create_item(
         location=item_data.location,
         user_id=current_user.id
     )
-    session.add(new_item)
-    session.commit()
-    session.refresh(new_item)
-    return new_item
+    statement = insert(Item).values(**new_item.model_dump()).returning(Item)
+
+    def operation(write_session: Session) -> ItemResponse:
+        # INSERT ... RETURNING: no refresh() round trip after commit
+        return ItemResponse.model_validate(write_session.scalars(statement).one())
+
+    return _write(session, operation)
 
 @router.get("", response_model=dict)
 def list_items(
@@ -110,29 +139,26 @@ def update_item(
     session: Session = Depends(get_session)
 ):
     """Update an item"""
-    item = session.get(Item, UUID(item_id))
-    
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found"
-        )
-    
-    if item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this item"
-        )
-    
-    if item_data.name is not None:
-        item.name = item_data.name
-    if item_data.location is not None:
-        item.location = item_data.location
-    
-    item.updated_at = datetime.utcnow()
-    session.add(item)
-    session.commit()
-    session.refresh(item)
+    item_uuid = UUID(item_id)
+    values = item_data.model_dump(exclude_none=True)
+    values["updated_at"] = datetime.utcnow()
+    
+    # Single owner-scoped UPDATE ... RETURNING, no preliminary read
+    statement = (
+        update(Item)
+        .where(Item.id == item_uuid, Item.user_id == current_user.id)
+        .values(**values)
+        .returning(Item)
+        .execution_options(synchronize_session=False)
+    )
+
+    def operation(write_session: Session) -> ItemResponse | None:
+        item = write_session.scalars(statement).one_or_none()
+        return ItemResponse.model_validate(item) if item is not None else None
+
+    item = _write(session, operation)
+    if item is None:
+        _raise_missing_or_forbidden(session, item_uuid, "update")
     
     return item
 
@@ -143,22 +169,21 @@ def delete_item(
     session: Session = Depends(get_session)
 ):
     """Delete an item"""
-    item = session.get(Item, UUID(item_id))
-    
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found"
-        )
-    
-    if item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this item"
-        )
-    
-    session.delete(item)
-    session.commit()
+    item_uuid = UUID(item_id)
+    
+    # Single owner-scoped DELETE, no preliminary read
+    statement = (
+        delete(Item)
+        .where(Item.id == item_uuid, Item.user_id == current_user.id)
+        .returning(Item.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    def operation(write_session: Session) -> UUID | None:
+        return write_session.scalars(statement).one_or_none()
+
+    if _write(session, operation) is None:
+        _raise_missing_or_forbidden(session, item_uuid, "delete")
     
     return None
 
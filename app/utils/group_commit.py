@@ -0,0 +1,103 @@
+import threading
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+from typing import Any, Callable, List, Optional, Tuple
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+WriteOperation = Callable[[Session], Any]
+
+
+class GroupCommitter:
+    """Coalesce concurrent small writes into one transaction and one commit.
+
+    Request threads hand a write operation to `submit` and block until it is
+    durable. A single worker thread drains whatever is queued (up to
+    `max_batch`, waiting at most `window_ms` for stragglers), runs every
+    operation on a shared session and commits once. If the batch fails, each
+    operation is replayed in its own transaction so one bad write cannot fail
+    its neighbours.
+    """
+
+    def __init__(self, engine: Engine, max_batch: int = 64, window_ms: int = 0):
+        self.engine = engine
+        self.max_batch = max(1, max_batch)
+        self.window = max(0, window_ms) / 1000
+        self._queue: Queue = Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, operation: WriteOperation) -> Any:
+        """Queue a write and wait for the commit that includes it"""
+        future: Future = Future()
+        # Enqueue under the lock so a concurrent stop() cannot slip its
+        # sentinel in ahead of this entry and strand it in the queue
+        with self._lock:
+            self._ensure_started()
+            self._queue.put((operation, future))
+        return future.result()
+
+    def stop(self):
+        """Flush pending writes and stop the worker thread"""
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_started(self):
+        # Caller must hold self._lock
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="group-commit", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stopping = False
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        entry = self._queue.get(timeout=remaining)
+                    else:
+                        entry = self._queue.get_nowait()
+                except Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self._flush(batch)
+            if stopping:
+                return
+
+    def _flush(self, batch: List[Tuple[WriteOperation, Future]]):
+        try:
+            with Session(self.engine) as session:
+                results = [operation(session) for operation, _ in batch]
+                session.commit()
+        except Exception:
+            for operation, future in batch:
+                self._run_single(operation, future)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _run_single(self, operation: WriteOperation, future: Future):
+        try:
+            with Session(self.engine) as session:
+                result = operation(session)
+                session.commit()
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+        future.set_result(result)
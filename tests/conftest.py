@@ -0,0 +1,68 @@
+import os
+
+# Settings are read at import time; provide the required values for tests
+os.environ.setdefault("DATABASE_URL", "sqlite:///./mindo_test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+from app.database import get_session
+from app.dependencies.auth import get_current_user
+from app.main import app
+from app.models.models import User
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine):
+    """Leading SQL keyword of every statement sent to the database"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def users(engine):
+    with Session(engine, expire_on_commit=False) as session:
+        owner = User(email="owner@example.com", password_hash="x")
+        other = User(email="other@example.com", password_hash="x")
+        session.add(owner)
+        session.add(other)
+        session.commit()
+    return {"owner": owner, "other": other}
+
+
+@pytest.fixture
+def client(engine, users):
+    """Test client on SQLite, authenticated as users["owner"] by default"""
+    current = {"user": users["owner"]}
+
+    def override_get_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_current_user] = lambda: current["user"]
+    client = TestClient(app)
+    client.login_as = lambda user: current.update(user=user)
+    yield client
+    app.dependency_overrides.clear()
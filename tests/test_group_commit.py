@@ -0,0 +1,117 @@
+import threading
+import time
+from uuid import uuid4
+import pytest
+from sqlalchemy import event, func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from app.models.models import Item
+from app.utils.group_commit import GroupCommitter
+
+
+@pytest.fixture
+def commits(engine):
+    counter = []
+
+    def record(conn):
+        counter.append(1)
+
+    event.listen(engine, "commit", record)
+    yield counter
+    event.remove(engine, "commit", record)
+
+
+def _insert_item(item_id):
+    statement = insert(Item).values(
+        id=item_id, user_id=uuid4(), name="item", location="shelf"
+    )
+
+    def operation(session):
+        session.execute(statement)
+        return item_id
+
+    return operation
+
+
+def _submit_behind_blocked_batch(committer, operations):
+    """Hold the worker on a first write until all operations are queued"""
+    started = threading.Event()
+    release = threading.Event()
+    results = {}
+
+    def blocking(session):
+        started.set()
+        release.wait()
+        return "first"
+
+    def submit(key, operation):
+        try:
+            results[key] = committer.submit(operation)
+        except Exception as exc:
+            results[key] = exc
+
+    first = threading.Thread(target=submit, args=("first", blocking))
+    first.start()
+    started.wait()
+
+    threads = [
+        threading.Thread(target=submit, args=(key, operation))
+        for key, operation in operations.items()
+    ]
+    for thread in threads:
+        thread.start()
+    while committer._queue.qsize() < len(operations):
+        time.sleep(0.001)
+
+    release.set()
+    for thread in [first, *threads]:
+        thread.join()
+    return results
+
+
+def _item_count(engine):
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(Item)).one()
+
+
+def test_concurrent_writes_share_commits(engine, commits):
+    committer = GroupCommitter(engine)
+    ids = [uuid4() for _ in range(10)]
+
+    results = _submit_behind_blocked_batch(
+        committer, {item_id: _insert_item(item_id) for item_id in ids}
+    )
+    committer.stop()
+
+    assert all(results[item_id] == item_id for item_id in ids)
+    assert _item_count(engine) == len(ids)
+    assert len(commits) == 1
+
+
+def test_failing_write_only_fails_its_caller(engine):
+    committer = GroupCommitter(engine)
+    existing = uuid4()
+    committer.submit(_insert_item(existing))
+    ids = [uuid4() for _ in range(4)]
+    operations = {item_id: _insert_item(item_id) for item_id in ids}
+    operations["duplicate"] = _insert_item(existing)
+
+    results = _submit_behind_blocked_batch(committer, operations)
+    committer.stop()
+
+    assert isinstance(results["duplicate"], IntegrityError)
+    assert all(results[item_id] == item_id for item_id in ids)
+    assert _item_count(engine) == len(ids) + 1
+
+
+def test_stop_flushes_and_worker_restarts(engine):
+    committer = GroupCommitter(engine)
+    committer.stop()
+
+    first, second = uuid4(), uuid4()
+    assert committer.submit(_insert_item(first)) == first
+    committer.stop()
+    assert committer.submit(_insert_item(second)) == second
+    committer.stop()
+
+    assert _item_count(engine) == 2
@@ -0,0 +1,81 @@
+def _create(client, name="keys", location="desk"):
+    response = client.post("/api/items", json={"name": name, "location": location})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_create_item_is_single_insert(client, statements):
+    statements.clear()
+    item = _create(client)
+
+    assert statements == ["INSERT"]
+    assert item["name"] == "keys"
+    assert item["location"] == "desk"
+
+
+def test_update_item_is_single_update(client, statements):
+    item = _create(client)
+
+    statements.clear()
+    response = client.patch(f"/api/items/{item['id']}", json={"name": "car keys"})
+
+    assert response.status_code == 200
+    assert statements == ["UPDATE"]
+    assert response.json()["name"] == "car keys"
+    assert response.json()["location"] == "desk"
+    assert response.json()["created_at"] == item["created_at"]
+
+
+def test_delete_item_is_single_delete(client, statements):
+    item = _create(client)
+
+    statements.clear()
+    response = client.delete(f"/api/items/{item['id']}")
+
+    assert response.status_code == 204
+    assert statements == ["DELETE"]
+    assert client.get(f"/api/items/{item['id']}").status_code == 404
+
+
+def test_update_missing_item_returns_404(client, statements):
+    statements.clear()
+    response = client.patch(
+        "/api/items/00000000-0000-0000-0000-000000000000", json={"name": "x"}
+    )
+
+    assert response.status_code == 404
+    assert statements == ["UPDATE", "SELECT"]
+
+
+def test_update_other_users_item_returns_403(client, users, statements):
+    item = _create(client)
+    client.login_as(users["other"])
+
+    statements.clear()
+    response = client.patch(f"/api/items/{item['id']}", json={"name": "x"})
+
+    assert response.status_code == 403
+    assert statements == ["UPDATE", "SELECT"]
+    client.login_as(users["owner"])
+    assert client.get(f"/api/items/{item['id']}").json()["name"] == "keys"
+
+
+def test_delete_missing_item_returns_404(client, statements):
+    statements.clear()
+    response = client.delete("/api/items/00000000-0000-0000-0000-000000000000")
+
+    assert response.status_code == 404
+    assert statements == ["DELETE", "SELECT"]
+
+
+def test_delete_other_users_item_returns_403(client, users, statements):
+    item = _create(client)
+    client.login_as(users["other"])
+
+    statements.clear()
+    response = client.delete(f"/api/items/{item['id']}")
+
+    assert response.status_code == 403
+    assert statements == ["DELETE", "SELECT"]
+    client.login_as(users["owner"])
+    assert client.get(f"/api/items/{item['id']}").status_code == 200